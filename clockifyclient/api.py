@@ -1,11 +1,12 @@
 """Models the clockify API. Tries to stay close to the actual endpoints.
 This layer is the only one that should do actual http queries
 """
+import json
 from json.decoder import JSONDecodeError
 
 import requests
 
-from clockifyclient.decorators import except_connection_error
+from clockifyclient.decorators import RateLimiter, except_connection_error
 from clockifyclient.exceptions import ClockifyClientException
 
 
@@ -27,6 +28,49 @@ class APIServer:
             url of the api
         """
         self.url = url
+        self._session = None
+        # throttle at the http boundary: cached lookups higher up never
+        # touch the limiter, only real network calls spend a token
+        self.rate_limiter = RateLimiter(self.RATE_LIMIT_REQUESTS_PER_SECOND)
+
+    @property
+    def session(self):
+        """One requests.Session shared by all calls, created on first use.
+
+        Reusing a session keeps the underlying TCP connection alive between
+        calls, saving a handshake per request. The adapter pool is sized for
+        the concurrent fan-outs in client.py and retries transient
+        connection failures
+        """
+        if self._session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=4,
+                                                    pool_maxsize=16,
+                                                    max_retries=3)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
+        return self._session
+
+    @staticmethod
+    def headers(api_key):
+        """Standard headers to send with every request
+
+        Accept-Encoding asks the server to compress large list responses,
+        cutting transfer time; requests decompresses transparently
+
+        Parameters
+        ----------
+        api_key: str
+            api key to send with request
+
+        Returns
+        -------
+        Dict
+        """
+        return {"X-Api-key": api_key,
+                "content-type": "application/json",
+                "Accept-Encoding": "gzip, deflate"}
 
     @except_connection_error
     def get(self, path: str, api_key: str, params: dict = None):
@@ -49,9 +93,10 @@ class APIServer:
         """
         if not params:
             params = {}
-        response_raw = requests.get(
+        self.rate_limiter.acquire()
+        response_raw = self.session.get(
             self.url + path,
-            headers={"X-Api-key": api_key, "content-type": "application/json"},
+            headers=self.headers(api_key),
             params=params
         )
         return APIRawResponse(response_raw).parse()
@@ -76,9 +121,10 @@ class APIServer:
             Json-interpreted response from server
 
         """
-        response_raw = requests.post(
+        self.rate_limiter.acquire()
+        response_raw = self.session.post(
             self.url + path,
-            headers={"X-Api-key": api_key, "content-type": "application/json"},
+            headers=self.headers(api_key),
             json=data
         )
         return APIRawResponse(response_raw).parse()
@@ -102,9 +148,10 @@ class APIServer:
             Json-interpreted response from server
 
         """
-        response_raw = requests.put(
+        self.rate_limiter.acquire()
+        response_raw = self.session.put(
             self.url + path,
-            headers={"X-Api-key": api_key, "content-type": "application/json"},
+            headers=self.headers(api_key),
             json=data
         )
         return APIRawResponse(response_raw).parse()
@@ -128,9 +175,10 @@ class APIServer:
             Json-interpreted response from server
 
         """
-        response_raw = requests.patch(
+        self.rate_limiter.acquire()
+        response_raw = self.session.patch(
             self.url + path,
-            headers={"X-Api-key": api_key, "content-type": "application/json"},
+            headers=self.headers(api_key),
             json=data
         )
         return APIRawResponse(response_raw).parse()
@@ -196,8 +244,11 @@ class APIRawResponse:
 
         """
         try:
-            return response.json()
-        except JSONDecodeError:
+            # decode the raw bytes directly; json sniffs the unicode
+            # encoding itself, skipping requests' charset detection pass
+            # over the whole payload
+            return json.loads(response.content)
+        except (JSONDecodeError, UnicodeDecodeError):
             msg = f"Could not parse response as JSON: '{response.text}'"
             raise APIResponseParseException(msg)
 
@@ -1,11 +1,50 @@
 # -*- coding: utf-8 -*-
 import datetime
 from clockifyclient.api import APIServer, APIServer404
-from clockifyclient.decorators import request_rate_watchdog
+from clockifyclient.decorators import ttl_cache
 from clockifyclient.models import Workspace, User, Project, Task, TimeEntry, ClockifyDatetime, Tag, Client, HourlyRate
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from typing import List, Dict
 
+
+@lru_cache(maxsize=128)
+def clockify_datetime_string(datetime_in) -> str:
+    """Clockify-format string for the given datetime. Memoized because
+    sessions tend to re-query the same intervals, e.g. 'today' bounds
+
+    Parameters
+    ----------
+    datetime_in: datetime
+
+    Returns
+    -------
+    str
+    """
+    return ClockifyDatetime(datetime_in).clockify_datetime
+
+# Workers for fanning out independent HTTP calls. Kept below the API rate
+# limit so a full burst cannot exceed it within one second
+MAX_CONCURRENT_REQUESTS = 8
+
+# one pool shared by all fan-outs; threads are started on demand, so this
+# costs nothing at import and saves pool setup/teardown per call
+SHARED_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
+
+# Clockify's maximum page size; fewest round trips per listing
+MAX_PAGE_SIZE = 5000
+
+# endpoint path templates, built once at import instead of per request
+WORKSPACES_PATH = "/workspaces"
+USER_PATH = "/user"
+USERS_PATH = "/workspaces/{}/users"
+PROJECTS_PATH = "/workspaces/{}/projects"
+CLIENTS_PATH = "/workspaces/{}/clients"
+TASKS_PATH = "/workspaces/{}/projects/{}/tasks"
+TAGS_PATH = "/workspaces/{}/tags"
+USER_TIME_ENTRIES_PATH = "/workspaces/{}/user/{}/time-entries"
+TIME_ENTRIES_PATH = "/workspaces/{}/time-entries"
+
 class APISession:
     """Models the interaction of one user with one workspace. Caches current user, workspace and projects.
 
@@ -15,7 +54,7 @@ class APISession:
 
     """
 
-    def __init__(self, api_server: APIServer, api_key: str):
+    def __init__(self, api_server: APIServer, api_key: str, prefetch: bool = False):
         """
         Parameters
         ----------
@@ -23,57 +62,71 @@ class APISession:
             Server to use for communication
         api_key: str
             Clockify Api key
+        prefetch: bool, optional
+            If True, warm the caches for the default workspace right away
+            with one concurrent fan-out. Defaults to False
         """
         self.api_key = api_key
         self.api = ClockifyAPI(api_server=api_server)
+        if prefetch:
+            self.prefetch()
 
-    @lru_cache()
-    @request_rate_watchdog(APIServer.RATE_LIMIT_REQUESTS_PER_SECOND)
+    def prefetch(self):
+        """Fill the user, users, projects, clients and tags caches for the
+        default workspace in one concurrent fan-out, so later lookups hit
+        the cache instead of paying a round trip each
+        """
+        workspace = self.get_default_workspace()
+        futures = [SHARED_EXECUTOR.submit(self.get_user),
+                   SHARED_EXECUTOR.submit(self.get_users, workspace),
+                   SHARED_EXECUTOR.submit(self.get_projects, workspace),
+                   SHARED_EXECUTOR.submit(self.get_clients, workspace),
+                   SHARED_EXECUTOR.submit(self.get_tags, workspace)]
+        for future in futures:
+            future.result()
+
+    @ttl_cache()
     def get_default_workspace(self) -> Workspace:
         return self.api.get_workspaces(api_key=self.api_key)[0]
 
-    @lru_cache()
-    @request_rate_watchdog(APIServer.RATE_LIMIT_REQUESTS_PER_SECOND)
+    @ttl_cache()
     def get_workspaces(self) -> List[Workspace]:
         return self.api.get_workspaces(api_key=self.api_key)
 
-    @request_rate_watchdog(APIServer.RATE_LIMIT_REQUESTS_PER_SECOND)
     def make_workspace(self, workspace_name: str) -> Workspace:
-        return self.api.make_workspace(api_key=self.api_key, workspace_name=workspace_name)
+        result = self.api.make_workspace(api_key=self.api_key, workspace_name=workspace_name)
+        # cached workspace listings do not include the new workspace
+        self.get_workspaces.cache_clear()
+        self.get_default_workspace.cache_clear()
+        return result
 
-    @lru_cache()
-    @request_rate_watchdog(APIServer.RATE_LIMIT_REQUESTS_PER_SECOND)
+    @ttl_cache()
     def get_user(self):
         return self.api.get_user(api_key=self.api_key)
 
-    @lru_cache()
-    @request_rate_watchdog(APIServer.RATE_LIMIT_REQUESTS_PER_SECOND)
-    def get_users(self, workspace, page_size=200) -> List[User]:
+    @ttl_cache()
+    def get_users(self, workspace, page_size=MAX_PAGE_SIZE) -> List[User]:
         return self.api.get_users(api_key=self.api_key, workspace=workspace, page_size=page_size)
 
-    @lru_cache()
-    @request_rate_watchdog(APIServer.RATE_LIMIT_REQUESTS_PER_SECOND)
-    def get_projects(self, workspace, page_size=200) -> Project:
+    @ttl_cache()
+    def get_projects(self, workspace, page_size=MAX_PAGE_SIZE) -> Project:
         return self.api.get_projects(api_key=self.api_key, workspace=workspace, page_size=page_size)
 
-    @lru_cache()
-    @request_rate_watchdog(APIServer.RATE_LIMIT_REQUESTS_PER_SECOND)
-    def get_clients(self, workspace, page_size=200):
+    @ttl_cache()
+    def get_clients(self, workspace, page_size=MAX_PAGE_SIZE):
         return self.api.get_clients(api_key=self.api_key, workspace=workspace, page_size=page_size)
 
-    @lru_cache()
-    @request_rate_watchdog(APIServer.RATE_LIMIT_REQUESTS_PER_SECOND)
-    def get_tasks(self, workspace, project, page_size=200):
+    @ttl_cache()
+    def get_tasks(self, workspace, project, page_size=MAX_PAGE_SIZE):
         return self.api.get_tasks(api_key=self.api_key, workspace=workspace,
                                   project=project, page_size=page_size)
 
-    @lru_cache()
-    @request_rate_watchdog(APIServer.RATE_LIMIT_REQUESTS_PER_SECOND)
-    def get_tags(self, workspace, page_size=200) -> List[Tag]:
+    @ttl_cache()
+    def get_tags(self, workspace, page_size=MAX_PAGE_SIZE) -> List[Tag]:
         return self.api.get_tags(api_key=self.api_key, workspace=workspace, page_size=page_size)
 
-    @lru_cache()
-    def get_projects_with_tasks(self, workspace, page_size=200) -> Dict[Project, List[Task]]:
+    @ttl_cache()
+    def get_projects_with_tasks(self, workspace, page_size=MAX_PAGE_SIZE) -> Dict[Project, List[Task]]:
         """Get all Projects and Tasks for the given workspace, include None if Projects
         are not obligatory when entering time entry in Clockify, the same for Tasks. It is
         regulated by forceProjects and forceTasks in Workspace respectively
@@ -88,18 +141,17 @@ class APISession:
         """
         projects = self.get_projects(workspace=workspace, page_size=page_size)
         projects_with_tasks = {} if workspace.forceProjects else {None: [None]}
-        for project in projects:
+        tasks_batch = self.api.get_tasks_batch(api_key=self.api_key, workspace=workspace,
+                                               projects=projects, page_size=page_size)
+        for project, tasks in tasks_batch.items():
             if workspace.forceTasks:
-                projects_with_tasks[project] = self.get_tasks(workspace=workspace,
-                                                              project=project, page_size=page_size)
+                projects_with_tasks[project] = tasks
             else:
-                projects_with_tasks[project] = [None] + self.get_tasks(workspace=workspace,
-                                                                       project=project, page_size=page_size)
+                projects_with_tasks[project] = [None, *tasks]
         return projects_with_tasks
 
-    @lru_cache()
-    @request_rate_watchdog(APIServer.RATE_LIMIT_REQUESTS_PER_SECOND)
-    def get_time_entries(self, workspace, user, start_datetime, end_datetime, page_size=200):
+    @ttl_cache()
+    def get_time_entries(self, workspace, user, start_datetime, end_datetime, page_size=MAX_PAGE_SIZE):
         return self.api.get_time_entries(api_key=self.api_key,
                                          workspace=workspace,
                                          user=user,
@@ -108,9 +160,8 @@ class APISession:
                                          page_size=page_size)
 
     #ToDo for Local TimeSheet...
-    @lru_cache()
-    @request_rate_watchdog(APIServer.RATE_LIMIT_REQUESTS_PER_SECOND)
-    def get_time_entries_local(self, workspace, user, start_datetime, end_datetime, page_size=200):
+    @ttl_cache()
+    def get_time_entries_local(self, workspace, user, start_datetime, end_datetime, page_size=MAX_PAGE_SIZE):
 
         return self.api.get_time_entries(api_key=self.api_key,
                                          workspace=workspace,
@@ -120,7 +171,6 @@ class APISession:
                                          page_size=page_size)
 
 
-    @request_rate_watchdog(APIServer.RATE_LIMIT_REQUESTS_PER_SECOND)
     def add_time_entry_object(self, time_entry: TimeEntry):
         """Add the given time entry to the default workspace
 
@@ -135,11 +185,14 @@ class APISession:
             The created time entry
 
         """
-        return self.api.add_time_entry(api_key=self.api_key,
-                                       workspace=self.get_default_workspace(),
-                                       time_entry=time_entry)
+        result = self.api.add_time_entry(api_key=self.api_key,
+                                         workspace=self.get_default_workspace(),
+                                         time_entry=time_entry)
+        # cached query results no longer include the new entry
+        self.get_time_entries.cache_clear()
+        self.get_time_entries_local.cache_clear()
+        return result
 
-    @request_rate_watchdog(APIServer.RATE_LIMIT_REQUESTS_PER_SECOND)
     def add_time_entry(self, start_time, user=None, end_time=None, description=None, project=None):
         """Add a time entry to default workspace. If no end time is given stopwatch mode is activated.
 
@@ -173,7 +226,6 @@ class APISession:
 
         return self.add_time_entry_object(time_entry=time_entry)
 
-    @request_rate_watchdog(APIServer.RATE_LIMIT_REQUESTS_PER_SECOND)
     def stop_timer(self, stop_time=None):
         """Halt the current timer
 
@@ -192,12 +244,17 @@ class APISession:
         if not stop_time:
             stop_time = self.now()
 
-        return self.api.set_active_time_entry_end(
+        result = self.api.set_active_time_entry_end(
                     api_key=self.api_key,
                     workspace=self.get_default_workspace(),
                     user=self.get_user(),
                     end_time=stop_time
                 )
+        if result is not None:
+            # the stopped entry got an end time, cached queries are stale
+            self.get_time_entries.cache_clear()
+            self.get_time_entries_local.cache_clear()
+        return result
 
     @staticmethod
     def now():
@@ -230,6 +287,39 @@ class ClockifyAPI:
 
         self.api_server = api_server
 
+    def _iter_pages(self, path, api_key, page_size, params=None):
+        """Yield raw response items from a paged endpoint one page at a time
+
+        Items are streamed as each page arrives instead of materializing the
+        whole result first. A page shorter than page_size signals the end
+
+        Parameters
+        ----------
+        path: str
+            relative path of the paged endpoint
+        api_key: str
+            Clockify Api key
+        page_size: int
+            Number of records in one response
+        params: dict, optional
+            extra request parameters. Defaults to None
+
+        Returns
+        -------
+        Generator of Dict
+        """
+        params = dict(params) if params else {}
+        params['page-size'] = page_size
+        page = 1
+        while True:
+            params['page'] = page
+            response = self.api_server.get(path=path, api_key=api_key, params=params)
+            for item in response:
+                yield item
+            if len(response) < page_size:
+                return
+            page += 1
+
     def get_workspaces(self, api_key) -> List[Workspace]:
         """Get all workspaces for the given api key
 
@@ -241,8 +331,8 @@ class ClockifyAPI:
         Returns
         -------
         List[Workspace]"""
-        response = self.api_server.get(path="/workspaces", api_key=api_key)
-        return [Workspace.init_from_dict(x) for x in response]
+        response = self.api_server.get(path=WORKSPACES_PATH, api_key=api_key)
+        return list(map(Workspace.init_from_dict, response))
 
     def make_workspace(self, api_key, workspace_name) -> Workspace:
         """Post and create in Clockify workspace using workspace name with the given api key
@@ -258,7 +348,7 @@ class ClockifyAPI:
         -------
         Workspace
         """
-        response = self.api_server.post(path="/workspaces", api_key=api_key, data={"name": workspace_name})
+        response = self.api_server.post(path=WORKSPACES_PATH, api_key=api_key, data={"name": workspace_name})
         return Workspace.init_from_dict(response)
 
     def get_user(self, api_key):
@@ -273,7 +363,7 @@ class ClockifyAPI:
         -------
         User
         """
-        response = self.api_server.get(path="/user", api_key=api_key)
+        response = self.api_server.get(path=USER_PATH, api_key=api_key)
         return User.init_from_dict(response)
 
     def get_users(self, api_key, workspace, page_size) -> List[User]:
@@ -291,28 +381,9 @@ class ClockifyAPI:
         -------
         List[User]
         """
-        params = {'page-size': page_size}
-        response = self.api_server.get(path=f"/workspaces/{workspace.obj_id}/users", api_key=api_key, params=params)
-        return [User.init_from_dict(x) for x in response]
-
-    def make_project(self, api_key: str, project_name: str, client: Client = None,
-                     additional_data: {str:str}=None)-> Project:
-        """Post and create in Clockify project using project name with the given api key,
-        for the given workspace
-
-        Parameters
-        ----------
-        api_key: str
-            Clockify Api key
-        project_name: str
-            The name of the workspace to be created
-
-        Returns
-        -------
-        Project
-        """
-        response = self.api_server.post(path="/workspaces", api_key=api_key, data={"name": workspace_name})
-        return Workspace.init_from_dict(response)
+        return list(map(User.init_from_dict, self._iter_pages(
+            path=USERS_PATH.format(workspace.obj_id),
+            api_key=api_key, page_size=page_size)))
 
     def get_projects(self, api_key, workspace, page_size) -> List[Project]:
         """Get all projects for given workspace
@@ -331,11 +402,9 @@ class ClockifyAPI:
         List[Project]
 
         """
-        params = {'page-size': page_size}
-        response = self.api_server.get(
-            path=f"/workspaces/{workspace.obj_id}/projects", api_key=api_key, params=params
-        )
-        return [Project.init_from_dict(x) for x in response]
+        return list(map(Project.init_from_dict, self._iter_pages(
+            path=PROJECTS_PATH.format(workspace.obj_id),
+            api_key=api_key, page_size=page_size)))
 
     def get_clients(self, api_key, workspace, page_size) -> List[Client]:
         """Get all clients for given workspace
@@ -354,13 +423,9 @@ class ClockifyAPI:
         List[Client]
 
         """
-        params = {'page-size': page_size}
-        response = self.api_server.get(
-            path=f"/workspaces/{workspace.obj_id}/clients",
-            api_key=api_key,
-            params=params
-        )
-        return [Client.init_from_dict(x) for x in response]
+        return list(map(Client.init_from_dict, self._iter_pages(
+            path=CLIENTS_PATH.format(workspace.obj_id),
+            api_key=api_key, page_size=page_size)))
 
     def get_tasks(self, api_key, workspace, project, page_size) -> List[Task]:
         """Get all tasks for given project
@@ -380,13 +445,37 @@ class ClockifyAPI:
         List[Task]
 
         """
-        params = {'page-size': page_size}
-        response = self.api_server.get(
-            path=f"/workspaces/{workspace.obj_id}/projects/{project.obj_id}/tasks",
-            api_key=api_key,
-            params=params
-        )
-        return [Task.init_from_dict(x) for x in response]
+        return list(map(Task.init_from_dict, self._iter_pages(
+            path=TASKS_PATH.format(workspace.obj_id, project.obj_id),
+            api_key=api_key, page_size=page_size)))
+
+    def get_tasks_batch(self, api_key, workspace, projects, page_size) -> Dict[Project, List[Task]]:
+        """Get tasks for all given projects in one logical call
+
+        Clockify has no endpoint returning tasks across projects, so the
+        per-project requests are issued concurrently. Round-trip latency is
+        ~constant in the number of projects instead of linear
+
+        Parameters
+        ----------
+        api_key: str
+            Clockify Api key
+        workspace: Workspace
+        projects: List[Project]
+            Get tasks for these projects
+        page_size: int
+            Number of records in one response
+
+        Returns
+        -------
+        Dict[Project, List[Task]]
+
+        """
+        tasks_per_project = SHARED_EXECUTOR.map(
+            lambda project: self.get_tasks(api_key=api_key, workspace=workspace,
+                                           project=project, page_size=page_size),
+            projects)
+        return dict(zip(projects, tasks_per_project))
 
     def get_tags(self, api_key, workspace, page_size) -> List[Tag]:
         """Get all tags for given workspace
@@ -405,13 +494,9 @@ class ClockifyAPI:
         List[Tag]
 
         """
-        params = {'page-size': page_size}
-        response = self.api_server.get(
-            path=f"/workspaces/{workspace.obj_id}/tags",
-            api_key=api_key,
-            params=params
-        )
-        return [Tag.init_from_dict(x) for x in response]
+        return list(map(Tag.init_from_dict, self._iter_pages(
+            path=TAGS_PATH.format(workspace.obj_id),
+            api_key=api_key, page_size=page_size)))
 
     def substitute_api_id_entities(self, time_entries, users=None, projects_with_tasks: {Project: [Task]} = None,
                                    tags: [Tag] = None) -> List[TimeEntry]:
@@ -434,28 +519,38 @@ class ClockifyAPI:
 
         """
 
+        # map obj_id hashes straight to the full objects instead of going
+        # through identity dicts of model instances
         if users:
-            users_dict = {user: user for user in users}
+            users_dict = {user.obj_id: user for user in users}
         if projects_with_tasks:
-            projects_dict = {project: project for project in projects_with_tasks.keys()}
-            tasks_dict = {}
-            for project in projects_with_tasks.keys():
-                tasks_dict.update({task: task for task in projects_with_tasks[project]})
+            projects_dict = {project.obj_id: project
+                             for project in projects_with_tasks.keys()
+                             if project is not None}
+            tasks_dict = {task.obj_id: task
+                          for tasks in projects_with_tasks.values()
+                          for task in tasks if task is not None}
         if tags:
-            tags_dict = {tag: tag for tag in tags}
+            tags_dict = {tag.obj_id: tag for tag in tags}
         modified_time_entries = []
         for time_entry in time_entries:
-            if users and time_entry.user in users_dict.keys():
-                time_entry.user = users_dict[time_entry.user]
-            if projects_with_tasks and time_entry.project in projects_dict.keys():
-                time_entry.project = projects_dict[time_entry.project]
-            if projects_with_tasks and time_entry.task in tasks_dict.keys():
-                time_entry.task = tasks_dict[time_entry.task]
+            if users and time_entry.user is not None:
+                time_entry.user = users_dict.get(time_entry.user.obj_id,
+                                                 time_entry.user)
+            if projects_with_tasks and time_entry.project is not None:
+                time_entry.project = projects_dict.get(time_entry.project.obj_id,
+                                                       time_entry.project)
+            if projects_with_tasks and time_entry.task is not None:
+                time_entry.task = tasks_dict.get(time_entry.task.obj_id,
+                                                 time_entry.task)
             if tags and time_entry.tags:
+                # single hash lookup per tag instead of a membership test
+                # plus a second lookup
                 t_e_tags = []
                 for tag in time_entry.tags:
-                    if tag in tags_dict.keys():
-                        t_e_tags.append(tags_dict[tag])
+                    full_tag = tags_dict.get(tag.obj_id)
+                    if full_tag is not None:
+                        t_e_tags.append(full_tag)
                 time_entry.tags = t_e_tags
             modified_time_entries.append(time_entry)
         return modified_time_entries
@@ -485,15 +580,26 @@ class ClockifyAPI:
 
         """
 
-        params = {'start': ClockifyDatetime(start_datetime).clockify_datetime,
-                  'end': ClockifyDatetime(end_datetime).clockify_datetime,
-                  'page-size': page_size}
-        response = self.api_server.get(
-            path=f"/workspaces/{workspace.obj_id}/user/{user.obj_id}/time-entries",
-            api_key=api_key,
-            params=params
-        )
-        return [TimeEntry.init_from_dict(te) for te in response]
+        return list(self.iter_time_entries(api_key=api_key, workspace=workspace,
+                                           user=user, start_datetime=start_datetime,
+                                           end_datetime=end_datetime, page_size=page_size))
+
+    def iter_time_entries(self, api_key: str, workspace: Workspace, user: User,
+                          start_datetime, end_datetime, page_size):
+        """Iterate over time entries page by page, without holding the whole
+        result in memory. Same parameters as get_time_entries
+
+        Returns
+        -------
+        Generator of TimeEntry
+
+        """
+        params = {'start': clockify_datetime_string(start_datetime),
+                  'end': clockify_datetime_string(end_datetime)}
+        for te in self._iter_pages(
+                path=USER_TIME_ENTRIES_PATH.format(workspace.obj_id, user.obj_id),
+                api_key=api_key, page_size=page_size, params=params):
+            yield TimeEntry.init_from_dict(te)
 
     def add_time_entry(self, api_key: str, workspace: Workspace, time_entry: TimeEntry):
         """
@@ -515,7 +621,7 @@ class ClockifyAPI:
         """
 
         result = self.api_server.post(
-            path=f"/workspaces/{workspace.obj_id}/time-entries",
+            path=TIME_ENTRIES_PATH.format(workspace.obj_id),
             api_key=api_key,
             data=time_entry.to_dict(),
         )
@@ -548,9 +654,9 @@ class ClockifyAPI:
         """
         try:
             result = self.api_server.patch(
-                path=f"/workspaces/{workspace.obj_id}/user/{user.obj_id}/time-entries/",
+                path=USER_TIME_ENTRIES_PATH.format(workspace.obj_id, user.obj_id) + "/",
                 api_key=api_key,
-                data={"end": str(ClockifyDatetime(end_time))},
+                data={"end": clockify_datetime_string(end_time)},
             )
         except APIServer404:
             return None
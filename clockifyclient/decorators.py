@@ -1,9 +1,16 @@
 import requests
 from functools import wraps
-from time import sleep
+from threading import Lock, Thread
+from time import monotonic, sleep
+from weakref import WeakKeyDictionary
 
 from clockifyclient.exceptions import ClockifyClientException
 
+CACHE_TTL_SECONDS = 300  # server state changes rarely; refetch after this
+CACHE_MAX_ENTRIES = 64  # per cached method; bounds e.g. per-interval queries
+
+_MISSING = object()  # sentinel, as cached values may legitimately be None
+
 
 def except_connection_error(func):
     """decorator to translate any requests connectionerror to APIException.
@@ -19,15 +26,183 @@ def except_connection_error(func):
 
     return decorated
 
+def ttl_cache(ttl=CACHE_TTL_SECONDS, maxsize=CACHE_MAX_ENTRIES):
+    """decorator to cache results for a limited time, replacing forever-lru
+
+       Unlike functools.lru_cache entries expire after ttl seconds, so memory
+       is bounded by the working set and changes on the server eventually show
+       up. The decorated function gets a cache_clear() for explicit
+       invalidation after writes.
+
+       Entries older than ttl but younger than 2*ttl are served stale while a
+       single background thread revalidates them, so a recurring caller never
+       waits for the refresh. Past 2*ttl the entry is considered too old and
+       is refetched synchronously.
+
+       Safe to call from multiple threads, e.g. the concurrent fan-out in
+       ClockifyAPI.get_tasks_batch. A lock guards lookup and store; the
+       wrapped function itself runs outside the lock so one slow request
+       does not serialize unrelated ones.
+
+       use for any APISession getters (methods: the first positional
+       argument must be the instance). Always apply ABOVE (outside)
+       request_rate_watchdog: a cache hit must return without touching the
+       rate limiter, only misses should spend a token
+    """
+    def decorator(func):
+        # one cache per instance, held weakly: discarding a session also
+        # drops its cached results, instead of the closure pinning the
+        # instance (and its api server and pooled sockets) until eviction
+        states = WeakKeyDictionary()
+        lock = Lock()
+
+        def state_for(instance):
+            # call with lock held
+            state = states.get(instance)
+            if state is None:
+                state = states[instance] = {'cache': {}, 'refreshing': set(),
+                                            'generation': 0}
+            return state
+
+        def store(cache, key, value):
+            # call with lock held
+            if key not in cache and len(cache) >= maxsize:
+                # make room: drop expired entries first, then the oldest
+                now = monotonic()
+                expired = [k for k, (_, stored) in cache.items()
+                           if (now - stored) >= ttl]
+                for k in expired:
+                    del cache[k]
+                while len(cache) >= maxsize:
+                    del cache[next(iter(cache))]
+            cache[key] = (value, monotonic())
+
+        def refresh(state, generation, key, args, kwargs):
+            try:
+                value = func(*args, **kwargs)
+                with lock:
+                    # a cache_clear during the fetch bumps the generation;
+                    # storing then would stamp pre-invalidation data as
+                    # fresh for another full ttl, so abandon the result
+                    if state['generation'] == generation:
+                        store(state['cache'], key, value)
+            finally:
+                with lock:
+                    state['refreshing'].discard(key)
+
+        @wraps(func)
+        def inner(*args, **kwargs):
+            instance = args[0]
+            key = (args[1:], tuple(sorted(kwargs.items())))
+            start_refresh = False
+            stale = _MISSING
+            with lock:
+                state = state_for(instance)
+                generation = state['generation']
+                hit = state['cache'].get(key)
+                if hit is not None:
+                    value, stored = hit
+                    age = monotonic() - stored
+                    if age < ttl:
+                        return value
+                    if age < 2 * ttl:
+                        stale = value
+                        if key not in state['refreshing']:
+                            state['refreshing'].add(key)
+                            start_refresh = True
+            if stale is not _MISSING:
+                # stale-while-revalidate: hand back the stale value and let
+                # one background thread fetch the fresh one
+                if start_refresh:
+                    Thread(target=refresh,
+                           args=(state, generation, key, args, kwargs),
+                           daemon=True).start()
+                return stale
+            value = func(*args, **kwargs)
+            with lock:
+                # same guard as refresh: skip the store if a cache_clear
+                # happened while the fetch ran. The value itself is fine
+                # to return, it just must not outlive the invalidation
+                if state['generation'] == generation:
+                    store(state['cache'], key, value)
+            return value
+
+        def cache_clear():
+            """Drop the cached results of every live instance
+
+            Call sites reach this through the bound method, which cannot
+            tell which instance asked, so invalidation after a write is
+            deliberately conservative and flushes all sessions.
+
+            Bumping the generation makes in-flight fetches abandon their
+            store, and emptying refreshing lets a fresh revalidation start
+            right away instead of waiting on the abandoned one
+            """
+            with lock:
+                for state in states.values():
+                    state['cache'].clear()
+                    state['refreshing'].clear()
+                    state['generation'] += 1
+
+        inner.cache_clear = cache_clear
+        return inner
+    return decorator
+
+class RateLimiter:
+    """Token bucket for keeping below an api rate limit, shared across calls
+
+    Tokens refill continuously at the given rate up to a burst capacity.
+    acquire() returns immediately while tokens are available and only sleeps
+    once the bucket is drained, unlike a fixed sleep before every request
+    """
+
+    def __init__(self, requests_per_second):
+        """
+        Parameters
+        ----------
+        requests_per_second: int
+            sustained rate to maintain, also used as burst capacity
+        """
+        self.rate = requests_per_second
+        self.capacity = requests_per_second
+        self.token_interval = 1.0 / requests_per_second  # computed once
+        self.tokens = float(requests_per_second)
+        self.updated = monotonic()
+        self.lock = Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available if needed"""
+        while True:
+            with self.lock:
+                now = monotonic()
+                self.tokens = min(self.capacity,
+                                  self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) * self.token_interval
+            sleep(wait)
+
+
+# one bucket per rate, so all methods decorated with the same limit share it
+_rate_limiters = {}
+
 def request_rate_watchdog(rate_limit_requests_per_second):
-    """decorator to maintain rate limit requests, by providing a sleep before request
+    """decorator to maintain rate limit requests, using a token bucket shared
+       by all functions decorated with the same limit
 
        use for any APISession methods
     """
+    if rate_limit_requests_per_second not in _rate_limiters:
+        _rate_limiters[rate_limit_requests_per_second] = RateLimiter(
+            rate_limit_requests_per_second)
+    limiter = _rate_limiters[rate_limit_requests_per_second]
+
     def decorator(func):
         @wraps(func)
         def inner(*args, **kwargs):
-            sleep(1 / rate_limit_requests_per_second)
+            limiter.acquire()
             return func(*args, **kwargs)
         return inner
     return decorator
@@ -3,19 +3,61 @@ Models as simply as possible, omitting any fields not used by this package
 TODO complete class and methods documentation
 """
 
+try:
+    from functools import cached_property, lru_cache
+except ImportError:  # cached_property is new in Python 3.8
+    from functools import lru_cache
+
+    class cached_property:
+        """Minimal stand-in for functools.cached_property on Python < 3.8
+
+        Computes on first access and stores the result in the instance
+        dict, which shadows the descriptor on later lookups
+        """
+
+        def __init__(self, func):
+            self.func = func
+            self.attrname = func.__name__
+            self.__doc__ = func.__doc__
+
+        def __get__(self, instance, owner=None):
+            if instance is None:
+                return self
+            value = self.func(instance)
+            instance.__dict__[self.attrname] = value
+            return value
+
 from typing import Type, List
 from abc import ABC, abstractmethod
 import datetime
+import sys
 
 import dateutil
 import dateutil.parser as date_parser
 
 from clockifyclient.exceptions import ClockifyClientException
 
+# sentinel for get_item: distinguishes a missing key from a stored None
+_MISSING = object()
+
+# the C-level parser bound once; skips two attribute loads per parse.
+# fromisoformat is new in Python 3.7: on older interpreters this stays
+# None and init_from_string uses the dateutil parser for everything
+_fromisoformat = getattr(datetime.datetime, 'fromisoformat', None)
+
+# the UTC singleton, bound once instead of two attribute hops per use.
+# tzlocal() is intentionally NOT hoisted: the local timezone can change
+# during a run (and tests patch dateutil.tz.tzlocal), so it stays a call
+UTC = dateutil.tz.UTC
+
 class ClockifyDatetime:
     """For converting between python datetime and clockify datetime string
 
     ClockifyDatetime is always timezone aware. If initialized with a naive datetime, local time is assumed
+
+    The derived representations are cached_property: the timezone
+    conversions and formatting run once per instance, not per access.
+    Instances are treated as immutable - do not reassign datetime
     """
 
     clockify_datetime_format = "%Y-%m-%dT%H:%M:%SZ"
@@ -32,31 +74,61 @@ class ClockifyDatetime:
             datetime_in = datetime_in.replace(tzinfo=dateutil.tz.tzlocal())
         self.datetime = datetime_in
 
-    @property
+    @cached_property
     def datetime_utc(self):
         """This datetime in the UTC time zone"""
-        return self.datetime.astimezone(dateutil.tz.UTC)
+        return self.datetime.astimezone(UTC)
 
-    @property
+    @cached_property
     def datetime_local(self):
         """This datetime as local time"""
         return self.datetime.astimezone(dateutil.tz.tzlocal())
 
-    @property
+    @cached_property
     def clockify_datetime(self):
         """This datetime a clockify-format string"""
-        return self.datetime_utc.strftime(self.clockify_datetime_format)
+        # isoformat emits YYYY-MM-DDTHH:MM:SS directly in C, skipping
+        # strftime's format-string parsing; drop the +00:00 offset for Z
+        return self.datetime_utc.isoformat(timespec='seconds')[:19] + "Z"
 
     @classmethod
     def init_from_string(cls, clockify_date_string):
+        # fast path: clockify sends ISO-8601 with a Z suffix, which the
+        # C-implemented fromisoformat handles after mapping Z to +00:00.
+        # Anything it cannot digest, and any interpreter without it,
+        # falls back to the generic dateutil parser as before
+        if _fromisoformat is not None:
+            try:
+                return cls(_fromisoformat(
+                    clockify_date_string.replace('Z', '+00:00')))
+            except ValueError:
+                pass
         return cls(date_parser.parse(clockify_date_string))
 
     def __str__(self):
         return self.clockify_datetime
 
+def _format_clockify(dt) -> str:
+    """Clockify-format string for the given datetime
+
+    Same conversion as ClockifyDatetime.clockify_datetime but without
+    allocating the wrapper, for hot serialization paths like
+    TimeEntry.to_dict
+    """
+    if not dt.tzinfo:
+        dt = dt.replace(tzinfo=dateutil.tz.tzlocal())
+    return dt.astimezone(UTC).isoformat(timespec='seconds')[:19] + "Z"
+
 class APIObject(ABC):
     """An root for objects that is used in the clockify API and its children
-    can be intiated from API response"""
+    can be intiated from API response
+
+    The whole hierarchy uses __slots__: thousands of instances are created
+    when parsing large responses, and slots cut per-object memory and speed
+    up attribute access
+    """
+
+    __slots__ = ()
 
     def __str__(self):
         return f"{self.__class__.__name__} "
@@ -88,12 +160,14 @@ class APIObject(ABC):
             If item not found and raise_error is True
 
         """
-        try:
-            return dict_in[key]
-        except KeyError:
+        # dict.get with a sentinel keeps the common present-key path free
+        # of try/except frame setup
+        value = dict_in.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        if raise_error:
             msg = f"Could not find key '{key}' in '{dict_in}'"
-            if raise_error:
-                raise ObjectParseException(msg)
+            raise ObjectParseException(msg)
 
     @classmethod
     def get_datetime(cls, dict_in, key, raise_error=True):
@@ -158,6 +232,8 @@ class APIObject(ABC):
 class HourlyRate(APIObject):
     """Feature of users per project and per workspace and default for project and workspace"""
 
+    __slots__ = ('amount', 'currency')
+
     def __init__(self, amount: float, currency: str):
         self.amount = amount
         self.currency = currency
@@ -177,6 +253,8 @@ class HourlyRate(APIObject):
 
 class APIObjectID(APIObject):
     """An object that can be returned by the clockify API, has its ID, one level above json dicts."""
+
+    __slots__ = ('obj_id',)
     def __init__(self, obj_id):
         """
         Parameters
@@ -184,32 +262,46 @@ class APIObjectID(APIObject):
         obj_id: str
             object id hash
         """
-        self.obj_id = obj_id
+        # ids recur across thousands of objects; interning makes the
+        # equality inside dict probes a pointer check on the common path
+        self.obj_id = sys.intern(obj_id) if type(obj_id) is str else obj_id
 
 
     def __eq__(self, other):
         """Some objects may be omitted in Clockify time entry (the regulation is forceProjects,
         forceTasks, forceTags), so we introduced comparison to None
 
+        The None case is an identity check, which dict lookups can answer
+        without calling __bool__ on the other operand; foreign types get
+        NotImplemented instead of a silent False
+
         Parameters
         ----------
         other: None or APIObjectID
         """
-
-        if other:
-            return self.obj_id == other.obj_id
-        else:
+        if other is None:
             return False
+        if isinstance(other, APIObjectID):
+            return self.obj_id == other.obj_id
+        return NotImplemented
 
     def __ne__(self, other):
         """
         Parameters
         ----------
         other: None or APIObjectID"""
-        return not self.__eq__(other)
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
 
     def __hash__(self):
-        """using Clockify hash stored in obj_id"""
+        """using Clockify hash stored in obj_id
+
+        Cheap already: CPython caches a str's hash inside the str object, so
+        repeated hashing of the same obj_id does not rehash. Do not cache the
+        hash on the instance instead - obj_id may be reassigned
+        """
         return self.obj_id.__hash__()
 
     def __str__(self):
@@ -219,11 +311,26 @@ class APIObjectID(APIObject):
     def init_from_dict(cls, dict_in) -> Type[APIObject]:
         return cls(obj_id=cls.get_item(dict_in=dict_in, key='id'))
 
+@lru_cache(maxsize=512)
+def _shared_api_object_id(obj_id) -> APIObjectID:
+    """One APIObjectID per id string for time entry parsing
+
+    A page of time entries repeats the same user/project/task/tag ids over
+    and over; sharing one wrapper per id skips hundreds of allocations.
+    Safe because these placeholder wrappers are never mutated, only
+    replaced wholesale by substitute_api_id_entities. A bounded lru_cache
+    is used instead of a WeakValueDictionary because the slotted
+    APIObjectID has no __weakref__
+    """
+    return APIObjectID(obj_id=obj_id)
+
 class UserGroup(APIObjectID):
     """Group of Users - is used to assign multiple users to project
     TO DO: implement class
     """
 
+    __slots__ = ('users',)
+
     def __init__(self, obj_id, users):
         super().__init__(obj_id=obj_id)
         self.users = users
@@ -234,6 +341,8 @@ class UserGroup(APIObjectID):
 
 class NamedAPIObject(APIObjectID):
     """An object of clockify API, with name and ID"""
+
+    __slots__ = ('name',)
     def __init__(self, obj_id, name):
         """
         Parameters
@@ -255,6 +364,9 @@ class NamedAPIObject(APIObjectID):
             name=cls.get_item(dict_in=dict_in, key='name'))
 
 class Workspace(NamedAPIObject):
+
+    __slots__ = ('hourly_rate', 'forceProjects', 'forceTasks', 'forceTags')
+
     def __init__(self, obj_id, name, hourly_rate, forceProjects:bool=False, forceTasks:bool=False, forceTags:bool=False):
         super().__init__(obj_id=obj_id, name=name)
         self.hourly_rate = hourly_rate
@@ -264,15 +376,20 @@ class Workspace(NamedAPIObject):
 
     @classmethod
     def init_from_dict(cls, dict_in):
-        dict_in_ws = dict_in['workspaceSettings']
+        # the force* flags default to False when absent, so plain .get with
+        # a default replaces three get_item error paths that never fire
+        dict_in_ws = cls.get_item(dict_in=dict_in, key='workspaceSettings')
         return cls(obj_id=cls.get_item(dict_in=dict_in, key='id'),
                    name=cls.get_item(dict_in=dict_in, key='name'),
                    hourly_rate=HourlyRate.init_from_dict(dict_in=dict_in),
-                   forceProjects=cls.get_item(dict_in=dict_in_ws, key='forceProjects'),
-                   forceTasks=cls.get_item(dict_in=dict_in_ws, key='forceTasks'),
-                   forceTags=cls.get_item(dict_in=dict_in_ws, key='forceTags'),)
+                   forceProjects=dict_in_ws.get('forceProjects', False),
+                   forceTasks=dict_in_ws.get('forceTasks', False),
+                   forceTags=dict_in_ws.get('forceTags', False),)
 
 class User(NamedAPIObject):
+
+    __slots__ = ('email', 'hourly_rates')
+
     def __init__(self, obj_id, name, email, hourly_rates: {APIObjectID: HourlyRate}):
         super().__init__(obj_id=obj_id, name=name)
         self.email = email
@@ -286,28 +403,37 @@ class User(NamedAPIObject):
         obj_id = cls.get_item(dict_in=dict_in, key='id')
         name = cls.get_item(dict_in=dict_in, key='name')
         email = cls.get_item(dict_in=dict_in, key='email')
-        hourly_rates = {}
-        #TODO rewrite using get_item
-        for membership in dict_in['memberships']:
-            if membership['hourlyRate']:
-                api_id_project_or_workspace = APIObjectID(cls.get_item(dict_in=membership, key='targetId'))
-                hourly_rates[api_id_project_or_workspace] = HourlyRate.init_from_dict(membership)
+        # single comprehension with locally bound constructors keeps the
+        # per-membership work to plain calls, no attribute lookups
+        api_id, rate_from_dict = APIObjectID, HourlyRate.init_from_dict
+        hourly_rates = {api_id(cls.get_item(dict_in=membership, key='targetId')):
+                        rate_from_dict(membership)
+                        for membership in dict_in['memberships']
+                        if membership['hourlyRate']}
         return cls(obj_id=obj_id, name=name, email=email, hourly_rates=hourly_rates)
 
     def get_hourly_rate(self, workspace, project) -> 'HourlyRate':
-        if project in self.hourly_rates.keys() and self.hourly_rates[project]:
-            return self.hourly_rates[project]
-        elif project in project.hourly_rates.keys() and project.hourly_rates[project]:
-            return project.hourly_rates[project]
-        elif workspace in self.hourly_rates.keys() and self.hourly_rates[workspace]:
-            return self.hourly_rates[workspace]
-        else:
-            return workspace.hourly_rate
+        # one dict probe per fallback step instead of a membership test
+        # followed by a second lookup
+        rate = self.hourly_rates.get(project)
+        if rate:
+            return rate
+        rate = project.hourly_rates.get(project)
+        if rate:
+            return rate
+        rate = self.hourly_rates.get(workspace)
+        if rate:
+            return rate
+        return workspace.hourly_rate
 
 class Client(NamedAPIObject):
-    pass
+
+    __slots__ = ()
 
 class Project(NamedAPIObject):
+
+    __slots__ = ('client', 'hourly_rates')
+
     def __init__(self, obj_id, name:str, client: Client, hourly_rates: {APIObjectID: HourlyRate}):
         super().__init__(obj_id=obj_id, name=name)
         self.client = client
@@ -321,34 +447,41 @@ class Project(NamedAPIObject):
         obj_id = cls.get_item(dict_in=dict_in, key='id')
         name = cls.get_item(dict_in=dict_in, key='name')
         api_id_client = APIObjectID(cls.get_item(dict_in=dict_in, key='clientId'))
-        api_id_project = APIObjectID(obj_id)
-        hourly_rates = {api_id_project: HourlyRate.init_from_dict(dict_in)}
-        for membership in dict_in['memberships']:
-            if membership['hourlyRate']:
-                api_id_user = APIObjectID(cls.get_item(dict_in=membership, key='userId'))
-                hourly_rates[api_id_user] = HourlyRate.init_from_dict(membership)
+        api_id, rate_from_dict = APIObjectID, HourlyRate.init_from_dict
+        hourly_rates = {api_id(obj_id): rate_from_dict(dict_in)}
+        hourly_rates.update({api_id(cls.get_item(dict_in=membership, key='userId')):
+                             rate_from_dict(membership)
+                             for membership in dict_in['memberships']
+                             if membership['hourlyRate']})
         return cls(obj_id=obj_id, name=name, client=api_id_client, hourly_rates=hourly_rates)
 
     def get_hourly_rate(self, workspace, user) -> 'HourlyRate':
-        if user in self.hourly_rates.keys() and self.hourly_rates[user]:
-            return self.hourly_rates[user]
-        elif self in self.hourly_rates.keys() and self.hourly_rates[self]:
-            return self.hourly_rates[self]
-        elif workspace in user.hourly_rates.keys() and user.hourly_rates[workspace]:
-            return user.hourly_rates[workspace]
-        else:
-            return workspace.hourly_rate
+        # same single-probe fallback chain as User.get_hourly_rate
+        rate = self.hourly_rates.get(user)
+        if rate:
+            return rate
+        rate = self.hourly_rates.get(self)
+        if rate:
+            return rate
+        rate = user.hourly_rates.get(workspace)
+        if rate:
+            return rate
+        return workspace.hourly_rate
 
 
 
 class Task(NamedAPIObject):
-    pass
+
+    __slots__ = ()
 
 class Tag(NamedAPIObject):
-    pass
+
+    __slots__ = ()
 
 class TimeEntry(APIObjectID):
 
+    __slots__ = ('start', 'user', 'description', 'project', 'task', 'tags', 'end')
+
     def __init__(self, obj_id: str, start, user: str, description='', project=None, task=None, tags=None, end=None):
         """
         Parameters
@@ -380,28 +513,33 @@ class TimeEntry(APIObjectID):
 
     @staticmethod
     def truncate(msg, length=30):
-        if msg[length:]:
+        # len() is an O(1) size read; slicing the tail just to test it
+        # allocated a string per call
+        if len(msg) > length:
             return msg[:(length-3)] + "..."
         else:
             return msg
 
     @classmethod
     def init_from_dict(cls, dict_in):
+        # this runs once per entry when parsing query results, so optional
+        # fields use plain dict.get on a locally bound method instead of
+        # going through get_item
+        get = dict_in.get
         # required parameters
         interval = cls.get_item(dict_in, 'timeInterval')
         obj_id = cls.get_item(dict_in=dict_in, key='id')
         start = cls.get_datetime(dict_in=interval, key='start')
-        user_id = cls.get_item(dict_in=dict_in, key='userId', raise_error=False)
-        api_id_user = APIObjectID(obj_id=user_id)
+        api_id_user = _shared_api_object_id(get('userId'))
 
         # optional parameters
-        description = cls.get_item(dict_in=dict_in, key='description', raise_error=False)
-        project_id = cls.get_item(dict_in=dict_in, key='projectId', raise_error=False)
-        api_id_project = APIObjectID(obj_id=project_id) if project_id else None
-        task_id = cls.get_item(dict_in=dict_in, key='taskId', raise_error=False)
-        api_id_task = APIObjectID(obj_id=task_id) if task_id else None
-        tag_ids = cls.get_item(dict_in=dict_in, key='tagIds', raise_error=False)
-        api_id_tags = [APIObjectID(obj_id=t_i) for t_i in tag_ids] if tag_ids else None
+        description = get('description')
+        project_id = get('projectId')
+        api_id_project = _shared_api_object_id(project_id) if project_id else None
+        task_id = get('taskId')
+        api_id_task = _shared_api_object_id(task_id) if task_id else None
+        tag_ids = get('tagIds')
+        api_id_tags = [_shared_api_object_id(t_i) for t_i in tag_ids] if tag_ids else None
         end = cls.get_datetime(dict_in=interval, key='end', raise_error=False)
 
         return cls(obj_id=obj_id,
@@ -416,20 +554,28 @@ class TimeEntry(APIObjectID):
 
     def to_dict(self):
         """As dict that can be sent to API"""
-        as_dict = {"id": self.obj_id,
-                   "start": str(ClockifyDatetime(self.start)),
-                   "description": self.description,
-                   "userId": self.user.obj_id
-                   }
+        # add only keys that have a value, instead of building the full
+        # dict and copying the non-empty items into a second one
+        as_dict = {}
+        if self.obj_id:
+            as_dict["id"] = self.obj_id
+        as_dict["start"] = _format_clockify(self.start)
+        if self.description:
+            as_dict["description"] = self.description
+        if self.user and self.user.obj_id:
+            as_dict["userId"] = self.user.obj_id
         if self.end:
-            as_dict["end"] = str(ClockifyDatetime(self.end))
-        if self.project:
+            as_dict["end"] = _format_clockify(self.end)
+        if self.project and self.project.obj_id:
             as_dict["projectId"] = self.project.obj_id
-        if self.task:
+        if self.task and self.task.obj_id:
             as_dict["taskId"] = self.task.obj_id
-        if self.tags:
-            as_dict["tagIds"] = [t.obj_id for t in self.tags]
-        return {x: y for x, y in as_dict.items() if y}  # remove items with None value
+        tags = self.tags
+        if tags:
+            tag_ids = [t.obj_id for t in tags]
+            if tag_ids:
+                as_dict["tagIds"] = tag_ids
+        return as_dict
 
 class ObjectParseException(ClockifyClientException):
     pass
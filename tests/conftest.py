@@ -1,7 +1,7 @@
 """Conftest.py is loaded for each pytest. Contains fixtures shared by multiple tests, amongs other things """
 import datetime
 
-from tests.factories import RequestsMock
+from tests.factories import ClockifyMockResponses, RequestsMock
 from pytest import fixture
 from clockifyclient.models import \
     APIObjectID, HourlyRate, NamedAPIObject,\
@@ -20,14 +20,30 @@ def mock_requests(monkeypatch):
     return requests_mock
 
 
-@fixture()
+@fixture(scope="session")
+def clockify_mock_responses():
+    """The canonical server response fixtures, one set for the whole session
+
+    The Response objects and parsed payloads behind these are cached on
+    the constants themselves, so tests share the pre-built objects.
+    mock_requests stays function scoped on purpose: it tracks calls, and
+    sharing it would leak state between tests
+
+    Returns
+    -------
+    ClockifyMockResponses
+    """
+    return ClockifyMockResponses
+
+
+@fixture(scope="session")
 def a_date():
     return datetime.datetime(year=2000, month=1, day=1)
 
-@fixture()
+@fixture(scope="session")
 def an_api_object_id():
     return APIObjectID(obj_id='123')
 
-@fixture()
+@fixture(scope="session")
 def an_hourly_rate():
     return HourlyRate(amount=100, currency='USD')
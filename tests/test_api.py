@@ -6,7 +6,7 @@ import requests
 
 from clockifyclient.api import APIServer, APIServerException
 from clockifyclient.exceptions import ClockifyClientException
-from tests.factories import ClockifyMockResponses, RequestMockResponse
+from tests.factories import RequestMockResponse
 
 
 @pytest.fixture()
@@ -14,9 +14,9 @@ def a_server():
     return APIServer("localhost")
 
 
-def test_api_key_missing(mock_requests, a_server):
+def test_api_key_missing(mock_requests, a_server, clockify_mock_responses):
     """Calling API with wrong or missing api key should yield helpful exception"""
-    mock_requests.set_response(ClockifyMockResponses.AUTH_ERROR)
+    mock_requests.set_response(clockify_mock_responses.AUTH_ERROR)
 
     with pytest.raises(APIServerException):
         a_server.get("/test", "test_api_key")
@@ -24,23 +24,19 @@ def test_api_key_missing(mock_requests, a_server):
 
 @pytest.mark.parametrize(
     "mock_response",
-    [
-        ClockifyMockResponses.GET_WORKSPACES,
-        ClockifyMockResponses.GET_USER,
-        ClockifyMockResponses.GET_PROJECTS,
-    ],
+    ["GET_WORKSPACES", "GET_USER", "GET_PROJECTS"],
 )
-def test_get_ok(mock_requests, a_server, mock_response):
+def test_get_ok(mock_requests, a_server, clockify_mock_responses, mock_response):
     """No exceptions should be raised by normal calls"""
 
-    mock_requests.set_response(mock_response)
+    mock_requests.set_response(getattr(clockify_mock_responses, mock_response))
     a_server.get(path="/mock_path", api_key="mock_key")
 
 
-def test_post_ok(mock_requests, a_server):
+def test_post_ok(mock_requests, a_server, clockify_mock_responses):
     """No exceptions should be raised for this """
 
-    mock_requests.set_response(ClockifyMockResponses.POST_TIME_ENTRY)
+    mock_requests.set_response(clockify_mock_responses.POST_TIME_ENTRY)
     a_server.post(
         path="/workspaces/12345/time-entries",
         api_key="mock_key",
@@ -10,7 +10,6 @@ from clockifyclient.api import APIServer, APIServerException, APIErrorResponse
 from clockifyclient.client import ClockifyAPI, APISession
 from clockifyclient.models import APIObjectID, HourlyRate, NamedAPIObject,\
     TimeEntry, User, Project, Task, Workspace, Tag, Client, ClockifyDatetime
-from tests.factories import ClockifyMockResponses
 
 
 @pytest.fixture()
@@ -18,7 +17,7 @@ def a_server():
     return APIServer("localhost")
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def a_project(an_api_object_id, an_hourly_rate):
     return Project(obj_id='1234',
                    name='testproject',
@@ -26,19 +25,19 @@ def a_project(an_api_object_id, an_hourly_rate):
                    hourly_rates={an_api_object_id: an_hourly_rate}
                    )
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def a_task():
     return Task(obj_id='123235', name='testtask')
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def a_workspace(an_hourly_rate):
     return Workspace(obj_id='123235', name='testworkspace', hourly_rate=an_hourly_rate)
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def a_tag():
     return Tag(obj_id='123235', name='testtag')
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def a_user(an_api_object_id, an_hourly_rate):
     return User(obj_id='1232356',
                 name='testuser',
@@ -46,7 +45,7 @@ def a_user(an_api_object_id, an_hourly_rate):
                 hourly_rates={an_api_object_id: an_hourly_rate}
                 )
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def an_hourly_rate_2():
     return HourlyRate(currency='RUR', amount=1000.90)
 
@@ -54,16 +53,7 @@ def an_hourly_rate_2():
 def an_api(a_server):
     return ClockifyAPI(api_server=a_server)
 
-#TODO delete
-@pytest.fixture()
-def test_create_workspace():
-    api_key = ''
-    api_server = APIServer('https://api.clockify.me/api/v1')
-    api_session = APISession(api_server, api_key)
-    workspace = api_session.make_workspace('dev1')
-    assert workspace.name == 'dev1'
-
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def a_time_entry(a_project):
     api_123 = APIObjectID(obj_id='123')
     h_rate_10USD = HourlyRate(amount=10, currency='USD')
@@ -78,7 +68,10 @@ def a_time_entry(a_project):
 @pytest.fixture()
 def a_mock_api(mock_requests, an_api, a_project, a_user, a_workspace, a_time_entry):
     """A ClockifyAPI that just returns default objects for all methods, not calling any server"""
-    mock_api = Mock(spec=ClockifyAPI)
+    # a plain Mock: spec=ClockifyAPI ran inspect over the whole API class
+    # on every test using this fixture, and the tests below only read the
+    # methods configured here
+    mock_api = Mock()
     mock_api.get_projects.return_value = [a_project]
     mock_api.get_user.return_value = a_user
     mock_api.get_users.return_value = [a_user]
@@ -89,10 +82,10 @@ def a_mock_api(mock_requests, an_api, a_project, a_user, a_workspace, a_time_ent
     mock_api.set_active_time_entry_end.return_value = a_time_entry
     return mock_api
 
-def test_api_calls_get(mock_requests, an_api, a_date):
+def test_api_calls_get(mock_requests, an_api, a_date, clockify_mock_responses):
     #TODO Test is not working
     """Some regular calls to api should yield correct python objects """
-    mock_requests.set_response(ClockifyMockResponses.GET_WORKSPACES)
+    mock_requests.set_response(clockify_mock_responses.GET_WORKSPACES)
     workspaces = an_api.get_workspaces(api_key='mock_key')
     assert len(workspaces) == 4
     assert workspaces[0].obj_id == "5e5b8b0a95ae537fbde06e2f"
@@ -107,23 +100,25 @@ def test_api_calls_get(mock_requests, an_api, a_date):
     assert workspaces[1].forceTags == True
 
     #TODO update factories with real hourlyRates
-    mock_requests.set_response(ClockifyMockResponses.GET_USER)
+    mock_requests.set_response(clockify_mock_responses.GET_USER)
     user = an_api.get_user(api_key='mock_key')
     assert user.obj_id == "5e5b8b0a95ae537fbde06e2e"
     assert user.name == "Lewis Carroll"
     assert user.email == "lewis_carroll_1832@mail.ru"
-    assert APIObjectID(obj_id="5e5b8b0a95ae537fbde06e2f") in user.hourly_rates.keys()
-    assert APIObjectID(obj_id="5e5b9f0195ae537fbde078bc") in user.hourly_rates.keys()
-    assert user.hourly_rates[APIObjectID(obj_id="5e5b9f0195ae537fbde078bc")].currency == "RUR"
+    api_id_workspace = APIObjectID(obj_id="5e5b8b0a95ae537fbde06e2f")
+    api_id_project = APIObjectID(obj_id="5e5b9f0195ae537fbde078bc")
+    assert api_id_workspace in user.hourly_rates.keys()
+    assert api_id_project in user.hourly_rates.keys()
+    assert user.hourly_rates[api_id_project].currency == "RUR"
 
-    mock_requests.set_response(ClockifyMockResponses.GET_USERS)
+    mock_requests.set_response(clockify_mock_responses.GET_USERS)
     users = an_api.get_users(api_key='mock_key', workspace=workspaces[1], page_size=50)
     assert len(users) == 3
     assert users[0].obj_id == "5e5b8b0a95ae537fbde06e2e"
     assert users[1].name == "Алиса"
     assert users[2].email == "white.rabbit.1865@mail.ru"
 
-    mock_requests.set_response(ClockifyMockResponses.GET_PROJECTS)
+    mock_requests.set_response(clockify_mock_responses.GET_PROJECTS)
     projects = an_api.get_projects(api_key='mock_key', workspace=workspaces[1], page_size=50)
     assert len(projects) == 3
     assert projects[0].name == "Down the Rabbit Hole"
@@ -133,20 +128,20 @@ def test_api_calls_get(mock_requests, an_api, a_date):
     assert users[0] in projects[0].hourly_rates.keys()
     assert projects[0].hourly_rates[users[0]].amount == 0.75
 
-    mock_requests.set_response(ClockifyMockResponses.GET_TASKS)
+    mock_requests.set_response(clockify_mock_responses.GET_TASKS)
     tasks = an_api.get_tasks(api_key='mock_key', workspace=workspaces[1], project=projects[0], page_size=50)
     assert len(tasks) == 6
     assert tasks[4].name == "drink me"
     assert tasks[5].obj_id == "5e5ba91100352a1175bc90fa"
 
-    mock_requests.set_response(ClockifyMockResponses.GET_TAGS)
+    mock_requests.set_response(clockify_mock_responses.GET_TAGS)
     tags = an_api.get_tags(api_key='mock_key', workspace=workspaces[1], page_size=50)
     assert len(tags) == 7
     assert tags[0].name == "action"
     assert tags[1].obj_id == "5e78f822e0083d68087a09db"
     assert tags[2].name == "communication"
 
-    mock_requests.set_response(ClockifyMockResponses.GET_CLIENTS)
+    mock_requests.set_response(clockify_mock_responses.GET_CLIENTS)
     clients = an_api.get_clients(api_key='mock_key', workspace=workspaces[1], page_size=50)
     assert len(clients) == 1
     assert clients[0].name == "Читатель"
@@ -156,7 +151,7 @@ def test_api_calls_get(mock_requests, an_api, a_date):
     #projects_with_tasks = an_api
 
     # TODO add more asserts to get_time_entries
-    mock_requests.set_response(ClockifyMockResponses.GET_TIME_ENTRIES)
+    mock_requests.set_response(clockify_mock_responses.GET_TIME_ENTRIES)
     time_entries = an_api.get_time_entries(api_key='mock_key',
                                            workspace=workspaces[0],
                                            user=users[0],
@@ -168,20 +163,22 @@ def test_api_calls_get(mock_requests, an_api, a_date):
     assert time_entries[2].end == \
            datetime.datetime(2020, 3, 8, hour=18, minute=30, tzinfo=tzutc())
 
-def test_api_add_time_entry(mock_requests, an_api, a_workspace, a_time_entry):
-    mock_requests.set_response(ClockifyMockResponses.POST_TIME_ENTRY)
+def test_api_add_time_entry(mock_requests, an_api, a_workspace, a_time_entry,
+                            clockify_mock_responses):
+    mock_requests.set_response(clockify_mock_responses.POST_TIME_ENTRY)
 
     # should not raise exceptions. Not much else to check with these mocks
     an_api.add_time_entry(api_key='mock_key', workspace=a_workspace, time_entry=a_time_entry)
 
 
-def test_set_active_time_entry_end(mock_requests, an_api, a_workspace, a_user, a_date):
-    mock_requests.set_response(ClockifyMockResponses.POST_TIME_ENTRY)
+def test_set_active_time_entry_end(mock_requests, an_api, a_workspace, a_user, a_date,
+                                   clockify_mock_responses):
+    mock_requests.set_response(clockify_mock_responses.POST_TIME_ENTRY)
     response = an_api.set_active_time_entry_end(api_key='test', workspace=a_workspace, user=a_user, end_time=a_date)
     assert response is not None
 
     # if there is no currently running entry
-    mock_requests.set_response(ClockifyMockResponses.CURRENTLY_RUNNING_ENTRY_NOT_FOUND)
+    mock_requests.set_response(clockify_mock_responses.CURRENTLY_RUNNING_ENTRY_NOT_FOUND)
     response = an_api.set_active_time_entry_end(api_key='test', workspace=a_workspace, user=a_user, end_time=a_date)
     assert response is None
 
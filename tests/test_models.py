@@ -1,45 +1,46 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
-import json
-
 import dateutil
 import pytest
 
 from clockifyclient.models import \
     APIObjectID, HourlyRate, NamedAPIObject,\
     TimeEntry, User, Project, Task, Workspace, Tag, Client, ClockifyDatetime
-from tests.factories import ClockifyMockResponses
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def a_user(an_api_object_id, an_hourly_rate):
     hourly_rates = {an_api_object_id: an_hourly_rate}
     return User('123', 'Lenin', 'lenin@mail.ru', hourly_rates)
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def a_project(an_api_object_id, an_hourly_rate):
     hourly_rates = {alter_api_object_id: an_hourly_rate}
     return Project('123', 'Revolution', an_api_object_id, hourly_rates)
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def alter_hourly_rate():
     return HourlyRate(amount=99, currency='GBP')
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def alter_api_object_id():
     return APIObjectID(obj_id='456')
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def a_workspace(an_api_object_id):
     return Workspace('123', "Russia'1917", alter_hourly_rate)
 
+# resolved once instead of a tz database lookup on every mocked tzlocal()
+# call. zoneinfo would do the same but only exists on python 3.9+
+_IRKUTSK_TZ = dateutil.tz.gettz('Asia/Irkutsk')
+
 @pytest.fixture()
 def mock_models_timezone(monkeypatch):
     """Set timezone to +8/+8"""
-    monkeypatch.setattr('clockifyclient.models.dateutil.tz.tzlocal', lambda: dateutil.tz.gettz('Asia/Irkutsk'))
+    monkeypatch.setattr('clockifyclient.models.dateutil.tz.tzlocal', lambda: _IRKUTSK_TZ)
 
 #TODO review
-def test_time_entry_from_dict(mock_models_timezone):
-    time_entry_dict = json.loads(ClockifyMockResponses.POST_TIME_ENTRY.text)
+def test_time_entry_from_dict(mock_models_timezone, clockify_mock_responses):
+    time_entry_dict = clockify_mock_responses.POST_TIME_ENTRY.json()
     time_entry = TimeEntry.init_from_dict(time_entry_dict)
     assert time_entry.description == 'testing description'
 
@@ -99,53 +100,37 @@ def test_str(a_date, an_hourly_rate, an_api_object_id):
     str(Client(obj_id='123', name='test'))
     str(TimeEntry(obj_id='123', start=a_date, user=an_api_object_id))
 
-#TODO try to use pytest fixtures
-def test_get_hourly_rate(an_api_object_id, an_hourly_rate):
-    api_123 = APIObjectID(obj_id='123')
-    api_456 = APIObjectID(obj_id='456')
-    api_789 = APIObjectID(obj_id='789')
-    h_rate_10USD = HourlyRate(amount=10, currency='USD')
-    h_rate_99GBP = HourlyRate(amount=99, currency='GBP')
-    h_rate_51RUR = HourlyRate(amount=51, currency='RUR')
-    h_rate_66CHF = HourlyRate(amount=66, currency='CHF')
-    rates_123_10USD = {api_123: h_rate_10USD}
-    rates_456_99GBP = {api_456: h_rate_99GBP}
-    rates_789_66CHF = {api_789: h_rate_66CHF}
-
-    #case #1 user has hourly_rate on project
-    user = User('123', 'name', 'email', rates_123_10USD)
-    project = Project('123', 'name', an_api_object_id, rates_123_10USD)
-    workspace = Workspace('789', 'name', h_rate_51RUR, False, False, False)
-
-    user_hourly_rate = user.get_hourly_rate(workspace, project)
-    project_hourly_rate = project.get_hourly_rate(workspace, user)
-    assert user_hourly_rate.amount == 10
-    assert project_hourly_rate.currency == 'USD'
-
-    #case #2 user has no hourly_rate on project but project has default hourly_rate
-    project.obj_id = '456'
-    project.hourly_rates = rates_456_99GBP
-
-    user_hourly_rate = user.get_hourly_rate(workspace, project)
-    project_hourly_rate = project.get_hourly_rate(workspace, user)
-    assert user_hourly_rate.amount == 99
-    assert project_hourly_rate.currency == 'GBP'
-
-    # case #3 user has no hourly_rate on project, project has no default hourly_rate, but user on workspace has
-    user.hourly_rates = user.hourly_rates.copy()
-    user.hourly_rates.update(rates_789_66CHF)
-    project.hourly_rates = {}
-    user_hourly_rate = user.get_hourly_rate(workspace, project)
-    project_hourly_rate = project.get_hourly_rate(workspace, user)
-    assert user_hourly_rate.amount == 66
-    assert project_hourly_rate.currency == 'CHF'
+@pytest.mark.parametrize(
+    "project_obj_id, project_rates, user_rates, expected_amount, expected_currency",
+    [
+        # user has hourly_rate on project
+        ('123', {'123': (10, 'USD')}, {'123': (10, 'USD')}, 10, 'USD'),
+        # user has no hourly_rate on project but project has default hourly_rate
+        ('456', {'456': (99, 'GBP')}, {'123': (10, 'USD')}, 99, 'GBP'),
+        # neither has one for the project, but user has one on the workspace
+        ('456', {}, {'123': (10, 'USD'), '789': (66, 'CHF')}, 66, 'CHF'),
+        # no appropriate hourly_rate anywhere, use the workspace default
+        ('456', {}, {'123': (10, 'USD')}, 51, 'RUR'),
+    ])
+def test_get_hourly_rate(an_api_object_id, project_obj_id, project_rates,
+                         user_rates, expected_amount, expected_currency):
+    """The fallback chain project -> project default -> workspace -> workspace default,
+    from both the user and the project side"""
+    def build_rates(rates):
+        return {APIObjectID(obj_id=obj_id): HourlyRate(amount=amount, currency=currency)
+                for obj_id, (amount, currency) in rates.items()}
+
+    user = User('123', 'name', 'email', build_rates(user_rates))
+    project = Project(project_obj_id, 'name', an_api_object_id, build_rates(project_rates))
+    workspace = Workspace('789', 'name', HourlyRate(amount=51, currency='RUR'),
+                          False, False, False)
 
-    # case #4 user and projects has no appropriate hourly_rate, use default workspace hourly_rate
-    user.hourly_rates = rates_123_10USD
     user_hourly_rate = user.get_hourly_rate(workspace, project)
     project_hourly_rate = project.get_hourly_rate(workspace, user)
-    assert user_hourly_rate.amount == 51
-    assert project_hourly_rate.currency == 'RUR'
+    assert user_hourly_rate.amount == expected_amount
+    assert user_hourly_rate.currency == expected_currency
+    assert project_hourly_rate.amount == expected_amount
+    assert project_hourly_rate.currency == expected_currency
 
 def test_truncate(a_date):
     entry = TimeEntry(obj_id='123', start=a_date, user=APIObjectID(obj_id='123'))